@@ -1,81 +1,186 @@
 import os
 import asyncio
+import hashlib
+import itertools
+import json
+import math
 import time
 import random
-import uuid
-from typing import Optional, Dict, Any
-from contextlib import asynccontextmanager
+from collections import deque
+from dataclasses import asdict, dataclass, replace
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+from typing import Optional, Dict, Any, AsyncIterator, Deque, List, Tuple, Union
+from urllib.parse import urlencode
 from enum import Enum
 
 import httpx
+import orjson
 import structlog
-from dotenv import load_dotenv
-
-load_dotenv()
 
 # Configure structured logging
 logger = structlog.get_logger(__name__)
 
 # Configuration
-MEZMO_API_KEY = os.getenv("MEZMO_API_KEY")
+# Environment (including any .env file) is loaded by the application
+# entrypoint; the API key is read lazily so this module imports without it.
 MEZMO_API_BASE_URL = os.getenv("MEZMO_API_BASE_URL", "https://api.mezmo.com")
 REQUEST_TIMEOUT = int(os.getenv("MEZMO_REQUEST_TIMEOUT", "30"))
+CONNECT_TIMEOUT = 5.0
 MAX_RETRIES = int(os.getenv("MEZMO_MAX_RETRIES", "3"))
 RETRY_DELAY = float(os.getenv("MEZMO_RETRY_DELAY", "1.0"))
-MAX_RETRY_DELAY = 30.0  # Cap retry delay at 30 seconds
+MAX_RETRY_DELAY = float(os.getenv("MEZMO_MAX_RETRY_DELAY", "30.0"))  # Cap retry delay
+
+# RNG used only for retry jitter; tests can reseed it for deterministic delays
+_rng = random.Random()
+
+# Capped exponential backoff per attempt, computed once; jitter scales these
+_BACKOFF_CAP = tuple(min(RETRY_DELAY * (2 ** i), MAX_RETRY_DELAY) for i in range(MAX_RETRIES))
+
+# Connection pool configuration
+MAX_CONNECTIONS = int(os.getenv("MEZMO_MAX_CONNS", "256"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("MEZMO_MAX_KEEPALIVE", "100"))
+# Match nginx's 75s default so idle connections survive between polls
+KEEPALIVE_EXPIRY = float(os.getenv("MEZMO_KEEPALIVE_EXPIRY", "75.0"))
+# Multiplex concurrent requests over one connection (falls back to HTTP/1.1
+# if the server doesn't negotiate h2)
+HTTP2_ENABLED = os.getenv("MEZMO_HTTP2", "true").lower() == "true"
 
 # Circuit breaker configuration
 CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))
 CIRCUIT_BREAKER_RECOVERY_TIMEOUT = float(os.getenv("CIRCUIT_BREAKER_RECOVERY_TIMEOUT", "60.0"))
 
-if not MEZMO_API_KEY:
-    raise RuntimeError("MEZMO_API_KEY is not set in environment variables.")
+# Default lookback window when no from_ts is given (6 hours)
+DEFAULT_TIME_WINDOW_SECONDS = 21600
+
+# Concurrent in-flight requests to the Mezmo API. The limit starts at
+# INITIAL_CONCURRENT_REQUESTS and is tuned with AIMD between the min and max.
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MEZMO_MAX_CONCURRENT", "20"))
+MIN_CONCURRENT_REQUESTS = int(os.getenv("MEZMO_MIN_CONCURRENT", "1"))
+INITIAL_CONCURRENT_REQUESTS = int(os.getenv("MEZMO_INITIAL_CONCURRENT", "8"))
+# Responses slower than this count as congestion and shrink the limit
+LATENCY_TARGET = float(os.getenv("MEZMO_LATENCY_TARGET", "5.0"))
+
+# Requests per minute allowed to the Export API (0 disables the limiter).
+# Requests past the budget wait client-side instead of drawing a 429.
+RATE_LIMIT_RPM = int(os.getenv("MEZMO_RATE_LIMIT_RPM", "60"))
+# Pause new requests once the server reports less than this share of its
+# rate limit remaining
+RATE_LIMIT_LOW_WATERMARK = 0.1
+
+# Response cache configuration (TTL in seconds, 0 disables)
+# Open-ended queries (no explicit from/to) track "now" so they expire quickly;
+# bounded historical windows are idempotent and can be kept longer.
+CACHE_TTL = float(os.getenv("MEZMO_CACHE_TTL", "5"))
+CACHE_TTL_BOUNDED = float(os.getenv("MEZMO_CACHE_TTL_BOUNDED", "60"))
+CACHE_MAX_ENTRIES = int(os.getenv("MEZMO_CACHE_MAX_ENTRIES", "256"))
+# Last-known-good responses older than this (seconds) are not served during an
+# outage; the original error is raised instead (0 never serves stale data)
+MAX_STALE_AGE = float(os.getenv("MEZMO_MAX_STALE_AGE", "600"))
+
+_api_key: Optional[str] = None
+
+
+def _get_api_key() -> str:
+    """Read MEZMO_API_KEY on first use and cache it."""
+    global _api_key
+    if _api_key is None:
+        _api_key = os.getenv("MEZMO_API_KEY")
+        if not _api_key:
+            raise RuntimeError("MEZMO_API_KEY is not set in environment variables.")
+    return _api_key
+
+# Export API v2 path, relative to the client's base_url
+_EXPORT_PATH = "/v2/export"
+
+# Static request headers, attached once to the shared client along with
+# the service key
+_HEADERS = {
+    "User-Agent": "Mezmo-MCP-Server/2.0.0",
+    "Accept": "application/json",
+}
 
 # Connection pool for efficient HTTP connections
 _http_client: Optional[httpx.AsyncClient] = None
+_http_client_lock = asyncio.Lock()
 
+# Consecutive connection failures before the shared client is rebuilt
+CONNECT_FAILURE_RESET_THRESHOLD = int(os.getenv("MEZMO_CONNECT_FAILURE_RESET_THRESHOLD", "3"))
+_connect_failures = 0
 
-@asynccontextmanager
-async def get_http_client():
+async def get_http_client() -> httpx.AsyncClient:
     """Get or create a shared HTTP client with connection pooling"""
     global _http_client
 
     if _http_client is None:
-        # Configure client with connection pooling and timeouts
-        limits = httpx.Limits(
-            max_keepalive_connections=10, max_connections=20, keepalive_expiry=30.0
-        )
+        async with _http_client_lock:
+            # Re-check: another task may have created the client while we waited
+            if _http_client is None:
+                # Configure client with connection pooling and timeouts
+                limits = httpx.Limits(
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=MAX_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                )
 
-        timeout = httpx.Timeout(connect=5.0, read=REQUEST_TIMEOUT, write=5.0, pool=2.0)
+                timeout = httpx.Timeout(connect=CONNECT_TIMEOUT, read=REQUEST_TIMEOUT, write=5.0, pool=2.0)
+
+                _http_client = httpx.AsyncClient(
+                    limits=limits,
+                    timeout=timeout,
+                    http2=HTTP2_ENABLED,
+                    base_url=MEZMO_API_BASE_URL,
+                    headers={**_HEADERS, "servicekey": _get_api_key()},
+                )
 
-        _http_client = httpx.AsyncClient(
-            limits=limits,
-            timeout=timeout,
-            headers={
-                "User-Agent": "Mezmo-MCP-Server/2.0.0",
-                "Accept": "application/json",
-            },
+                logger.info(
+                    "Created new HTTP client with connection pooling",
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                    http2=HTTP2_ENABLED,
+                )
+
+    # Individual request failures are handled by the caller; the shared pool
+    # is only torn down after repeated connection failures (see
+    # _record_connect_failure) so one bad request doesn't drop warm connections
+    # for every concurrent task.
+    return _http_client
+
+
+async def _record_connect_failure() -> None:
+    """
+    Track consecutive transport-level failures and rebuild the client past the threshold.
+
+    Only connect errors and pool timeouts count; HTTP errors, cancellation and
+    MezmoAPIError never tear down the shared pool.
+    """
+    global _connect_failures
+    _connect_failures += 1
+    if _connect_failures >= CONNECT_FAILURE_RESET_THRESHOLD:
+        logger.warning(
+            "Resetting HTTP client after repeated connection failures",
+            connect_failures=_connect_failures,
         )
+        _connect_failures = 0
+        await close_http_client()
 
-        logger.info("Created new HTTP client with connection pooling")
 
-    try:
-        yield _http_client
-    except Exception as e:
-        logger.error("HTTP client error", error=str(e))
-        # Close and recreate client on error
-        if _http_client:
-            await _http_client.aclose()
-            _http_client = None
-        raise
+def _reset_connect_failures() -> None:
+    """Clear the consecutive connection failure counter."""
+    global _connect_failures
+    _connect_failures = 0
 
 
 async def close_http_client():
     """Close the shared HTTP client"""
     global _http_client
-    if _http_client:
-        await _http_client.aclose()
-        _http_client = None
+    # Detach before closing so get_http_client() never hands out a client
+    # that is being closed; the next caller builds a fresh one
+    async with _http_client_lock:
+        client, _http_client = _http_client, None
+    if client is not None:
+        await client.aclose()
         logger.info("Closed HTTP client")
 
 
@@ -96,6 +201,135 @@ class MezmoAPIError(Exception):
         super().__init__(message)
 
 
+# Correlation IDs only need to be unique within this process's log stream; the
+# random part keeps them distinct across restarts that reuse a PID
+_CORRELATION_PREFIX = f"{os.getpid():x}-{random.getrandbits(32):08x}"
+_correlation_counter = itertools.count(1)
+
+
+def new_correlation_id() -> str:
+    """Return a per-process correlation ID: "<pid>-<random>-<sequence>" in hex."""
+    return f"{_CORRELATION_PREFIX}-{next(_correlation_counter):x}"
+
+
+@dataclass(frozen=True, slots=True)
+class FetchParams:
+    """
+    Validated query parameters for a Mezmo Export API v2 request.
+
+    Validation runs once at construction, so callers that reuse an instance
+    (e.g. across pages) don't repeat it.
+    """
+
+    count: int = 10
+    apps: Optional[str] = None
+    hosts: Optional[str] = None
+    levels: Optional[str] = None
+    query: Optional[str] = None
+    from_ts: Optional[str] = None
+    to_ts: Optional[str] = None
+    prefer: Optional[str] = "tail"
+    pagination_id: Optional[str] = None
+
+    def __post_init__(self):
+        # Validate parameters per Mezmo Export API v2 spec
+        if self.count < 1 or self.count > 10000:
+            raise ValueError(f"Count must be between 1 and 10,000 per API spec, got {self.count}")
+
+        if self.prefer not in ("head", "tail"):
+            raise ValueError(f"Prefer must be 'head' or 'tail', got {self.prefer}")
+
+    @property
+    def is_bounded(self) -> bool:
+        """True when both ends of the time window are given."""
+        return self.from_ts is not None and self.to_ts is not None
+
+    def to_query(self, now: int) -> Dict[str, Any]:
+        """
+        Map to Mezmo API v2 query parameters.
+
+        Mezmo requires both from and to timestamps (in seconds); missing ones
+        default to the last DEFAULT_TIME_WINDOW_SECONDS ending at now.
+        """
+        # NOTE: Do not set default levels - let Mezmo return all levels if not specified.
+        # Empty optional filters are dropped; size/prefer/from/to are always set.
+        from_ts = self.from_ts if self.from_ts is not None else str(now - DEFAULT_TIME_WINDOW_SECONDS)
+        to_ts = self.to_ts if self.to_ts is not None else str(now)
+        return {
+            k: v
+            for k, v in (
+                ("size", self.count),  # API uses 'size', we expose as 'count'
+                ("prefer", self.prefer),
+                ("from", from_ts),
+                ("to", to_ts),
+                ("apps", self.apps),
+                ("hosts", self.hosts),
+                ("levels", self.levels),
+                ("query", self.query),
+                ("pagination_id", self.pagination_id),
+            )
+            if v
+        }
+
+
+@lru_cache(maxsize=128)
+def _encode_query(items: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    Percent-encode request parameters once.
+
+    Memoized so polling loops that repeat the same query skip re-encoding.
+    Commas are left unescaped since Mezmo list parameters are comma-separated.
+    """
+    return urlencode(items, safe=",")
+
+
+def _response_snippet(response: httpx.Response, limit: int = 500) -> str:
+    """Decode only the first `limit` bytes of a response body for error reporting."""
+    return response.content[:limit].decode("utf-8", errors="replace")
+
+
+def _compute_backoff(attempt: int, retry_after: Optional[int] = None) -> float:
+    """
+    Delay before the next retry, in seconds.
+
+    Uses full jitter (uniform between 0 and the capped exponential delay) so
+    clients that failed together don't retry together. When the server sent
+    Retry-After, waits that long plus up to 20% jitter instead. Both are
+    capped at MAX_RETRY_DELAY.
+    """
+    if retry_after is not None:
+        return min(retry_after + _rng.uniform(0, retry_after * 0.2), MAX_RETRY_DELAY)
+    return _rng.random() * _BACKOFF_CAP[attempt]
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[int]:
+    """
+    Parse a Retry-After header into whole seconds.
+
+    Supports both forms allowed by RFC 7231: delay-seconds and an HTTP-date.
+    Fractional seconds, which some proxies send, are rounded up. Returns
+    None when the header is missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        return max(0, math.ceil(float(value)))
+    except (ValueError, OverflowError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0, math.ceil(retry_at.timestamp() - time.time()))
+
+
+# Breaker timing uses a monotonic clock so wall-clock jumps (NTP, DST) can't
+# shorten or stretch the OPEN window
+_monotonic = time.monotonic
+# High-resolution clock for request durations
+_perf = time.perf_counter
+
+
 class CircuitBreakerState(Enum):
     """Circuit breaker states"""
     CLOSED = "closed"      # Normal operation, requests pass through
@@ -111,7 +345,11 @@ class CircuitBreaker:
     States:
     - CLOSED: Normal operation, requests pass through
     - OPEN: Too many failures, requests are rejected immediately
-    - HALF_OPEN: Testing recovery, allows one request through
+    - HALF_OPEN: Testing recovery, allows exactly one probe request through
+
+    The lock only guards state transitions. Counter updates and checks in the
+    CLOSED state are plain attribute access, which is safe because none of it
+    awaits and all callers share one event loop.
     """
 
     def __init__(
@@ -124,50 +362,102 @@ class CircuitBreaker:
         self.state = CircuitBreakerState.CLOSED
         self.failure_count = 0
         self.last_failure_time: Optional[float] = None
+        self._probe_started_at: Optional[float] = None
         self._lock = asyncio.Lock()
 
+    def _acquire_probe(self) -> bool:
+        """
+        Claim the single HALF_OPEN probe slot.
+
+        A probe that never reports back (cancelled, or ended in an error that
+        doesn't touch the breaker) releases its slot after recovery_timeout.
+        """
+        now = _monotonic()
+        started = self._probe_started_at
+        if started is not None and now - started < self.recovery_timeout:
+            return False
+        self._probe_started_at = now
+        return True
+
     async def can_proceed(self) -> bool:
         """Check if a request can proceed based on circuit state."""
-        async with self._lock:
-            if self.state == CircuitBreakerState.CLOSED:
-                return True
+        # Fast path: plain reads, no lock. Nothing here awaits, so the event
+        # loop can't interleave another task between the check and return.
+        state = self.state
+        if state is CircuitBreakerState.CLOSED:
+            return True
+        if state is CircuitBreakerState.HALF_OPEN:
+            # Only one request at a time tests recovery
+            return self._acquire_probe()
 
-            if self.state == CircuitBreakerState.OPEN:
-                # Check if recovery timeout has elapsed
-                if self.last_failure_time and (time.time() - self.last_failure_time) >= self.recovery_timeout:
-                    self.state = CircuitBreakerState.HALF_OPEN
-                    logger.info(
-                        "Circuit breaker transitioning to HALF_OPEN",
-                        recovery_timeout=self.recovery_timeout,
-                    )
-                    return True
-                return False
+        # OPEN: check if recovery timeout has elapsed
+        last_failure_time = self.last_failure_time
+        if last_failure_time is None or (_monotonic() - last_failure_time) < self.recovery_timeout:
+            return False
 
-            # HALF_OPEN: allow one request through to test recovery
-            return True
+        async with self._lock:
+            # Re-check: another task may have transitioned while we waited
+            if self.state is CircuitBreakerState.OPEN:
+                self.state = CircuitBreakerState.HALF_OPEN
+                self._probe_started_at = None
+                logger.info(
+                    "Circuit breaker transitioning to HALF_OPEN",
+                    recovery_timeout=self.recovery_timeout,
+                )
+            elif self.state is CircuitBreakerState.CLOSED:
+                return True
+            return self._acquire_probe()
 
     async def record_success(self) -> None:
         """Record a successful request."""
+        if self.state is CircuitBreakerState.CLOSED:
+            # Fast path: only the counter needs resetting
+            self.failure_count = 0
+            return
+
         async with self._lock:
-            if self.state == CircuitBreakerState.HALF_OPEN:
+            if self.state is CircuitBreakerState.HALF_OPEN:
                 logger.info("Circuit breaker closing after successful recovery test")
             self.failure_count = 0
+            self._probe_started_at = None
             self.state = CircuitBreakerState.CLOSED
 
     async def record_failure(self) -> None:
-        """Record a failed request."""
-        async with self._lock:
-            self.failure_count += 1
-            self.last_failure_time = time.time()
+        """
+        Record a failed request attempt.
+
+        Only failures within recovery_timeout of each other accumulate; after a
+        longer quiet spell the count starts over.
+        """
+        now = _monotonic()
+        last_failure_time = self.last_failure_time
+        if (
+            self.state is CircuitBreakerState.CLOSED
+            and last_failure_time is not None
+            and now - last_failure_time >= self.recovery_timeout
+        ):
+            self.failure_count = 0
+        self.failure_count += 1
+        self.last_failure_time = now
 
-            if self.state == CircuitBreakerState.HALF_OPEN:
+        state = self.state
+        if state is CircuitBreakerState.CLOSED and self.failure_count < self.failure_threshold:
+            # Fast path: below threshold, no transition
+            return
+        if state is CircuitBreakerState.OPEN:
+            return
+
+        async with self._lock:
+            # Re-check under the lock before transitioning
+            if self.state is CircuitBreakerState.HALF_OPEN:
                 # Recovery test failed, go back to OPEN
                 self.state = CircuitBreakerState.OPEN
+                self._probe_started_at = None
                 logger.warning(
                     "Circuit breaker reopening after failed recovery test",
                     failure_count=self.failure_count,
                 )
-            elif self.failure_count >= self.failure_threshold:
+            elif self.state is CircuitBreakerState.CLOSED and self.failure_count >= self.failure_threshold:
                 self.state = CircuitBreakerState.OPEN
                 logger.warning(
                     "Circuit breaker opening due to failures",
@@ -176,13 +466,24 @@ class CircuitBreaker:
                 )
 
     def get_state(self) -> Dict[str, Any]:
-        """Get current circuit breaker state for monitoring."""
+        """
+        Get a lock-free snapshot of the circuit breaker state for monitoring.
+
+        last_failure_time is a time.monotonic() reading, only meaningful
+        relative to other readings in this process; seconds_since_last_failure
+        is provided for display.
+        """
+        last_failure_time = self.last_failure_time
         return {
             "state": self.state.value,
             "failure_count": self.failure_count,
             "failure_threshold": self.failure_threshold,
-            "last_failure_time": self.last_failure_time,
+            "last_failure_time": last_failure_time,
+            "seconds_since_last_failure": (
+                None if last_failure_time is None else round(_monotonic() - last_failure_time, 3)
+            ),
             "recovery_timeout": self.recovery_timeout,
+            "probe_in_flight": self._probe_started_at is not None,
         }
 
 
@@ -190,6 +491,279 @@ class CircuitBreaker:
 _circuit_breaker = CircuitBreaker()
 
 
+class AdaptiveConcurrencyLimiter:
+    """
+    Caps in-flight Mezmo requests with a limit tuned by AIMD.
+
+    Each healthy response grows the limit by 1/limit (about one slot per full
+    window of requests). A 429, a 5xx, a transport error or a response slower
+    than the latency target halves it, at most once per latency target, so a
+    burst of failures from one congestion event only backs off once.
+
+    Callers queue here instead of inside httpx's pool, so waiting is cheap and
+    queued requests are dispatched in order as slots free up. Like the circuit
+    breaker, it relies on all callers sharing one event loop and needs no lock.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = INITIAL_CONCURRENT_REQUESTS,
+        min_limit: int = MIN_CONCURRENT_REQUESTS,
+        max_limit: int = MAX_CONCURRENT_REQUESTS,
+        latency_target: float = LATENCY_TARGET,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.latency_target = latency_target
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return self
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before the cancellation
+            # landed; give it to the next waiter instead of leaking it
+            if not waiter.cancelled():
+                self._in_flight -= 1
+                self._wake()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._in_flight -= 1
+        if exc_type is not None and not issubclass(exc_type, asyncio.CancelledError):
+            self._decrease()
+        self._wake()
+
+    def record(self, status_code: int, duration: float) -> None:
+        """Adjust the limit from a completed response."""
+        if status_code == 429 or status_code >= 500 or duration > self.latency_target:
+            self._decrease()
+        elif self._limit < self.max_limit:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._wake()
+
+    def _decrease(self) -> None:
+        now = _monotonic()
+        if now - self._last_decrease < self.latency_target:
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self._limit = max(self.min_limit, self._limit / 2)
+        if self.limit != previous:
+            logger.info(
+                "Reduced Mezmo request concurrency",
+                previous_limit=previous,
+                limit=self.limit,
+            )
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def get_state(self) -> Dict[str, Any]:
+        """Get current limiter state for monitoring."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+        }
+
+
+# Global limiter for requests to the Export API
+_request_limiter = AdaptiveConcurrencyLimiter()
+
+
+def _header_number(headers: httpx.Headers, *names: str) -> Optional[float]:
+    """First of the named headers that parses as a number, else None."""
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                continue
+    return None
+
+
+class RequestRateLimiter:
+    """
+    Sliding-window limit on requests per minute to the Mezmo API.
+
+    Proactive: each request takes a slot from a rolling 60s window and waits
+    for the oldest one to expire when the budget is used up. Reactive: when a
+    response's x-ratelimit headers show the server-side budget nearly spent,
+    or a 429 carries a Retry-After, new requests are held until it resets.
+    """
+
+    def __init__(self, rpm: int = RATE_LIMIT_RPM, window: float = 60.0):
+        self.rpm = rpm
+        self.window = window
+        self._sent: Deque[float] = deque()
+        self._paused_until = 0.0
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._sent and self._sent[0] <= cutoff:
+            self._sent.popleft()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then claim a slot for it."""
+        if self.rpm <= 0 and self._paused_until == 0.0:
+            return
+        while True:
+            now = _monotonic()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+            if self.rpm <= 0:
+                return
+            self._prune(now)
+            if len(self._sent) < self.rpm:
+                self._sent.append(now)
+                return
+            await asyncio.sleep(self._sent[0] + self.window - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold new requests for the given number of seconds."""
+        until = _monotonic() + min(seconds, MAX_RETRY_DELAY)
+        if until > self._paused_until:
+            self._paused_until = until
+            logger.info("Pausing Mezmo requests for rate limit", seconds=round(seconds, 3))
+
+    def observe(self, response: httpx.Response) -> None:
+        """Pause when a response's rate-limit headers show the budget nearly spent."""
+        headers = response.headers
+        remaining = _header_number(
+            headers, "x-ratelimit-remaining", "x-ratelimit-remaining-requests"
+        )
+        limit = _header_number(headers, "x-ratelimit-limit", "x-ratelimit-limit-requests")
+        if remaining is None or not limit or remaining > limit * RATE_LIMIT_LOW_WATERMARK:
+            return
+
+        reset = _header_number(headers, "x-ratelimit-reset", "x-ratelimit-reset-requests")
+        self.pause(reset if reset is not None else 1.0)
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Get current limiter state for monitoring.
+
+        Read-only: the metrics gauge calls this from the Prometheus scrape
+        thread, so it counts a snapshot of the window instead of pruning it.
+        """
+        now = _monotonic()
+        cutoff = now - self.window
+        used = sum(1 for sent_at in list(self._sent) if sent_at > cutoff)
+        return {
+            "rpm": self.rpm,
+            "remaining": max(0, self.rpm - used) if self.rpm > 0 else None,
+            "paused_for": max(0.0, self._paused_until - now),
+        }
+
+
+# Global requests-per-minute limiter for the Export API
+_rate_limiter = RequestRateLimiter()
+
+# Response cache: key -> (expires_at, logs, pagination_id, has_more)
+_cache: Dict[str, Tuple[float, Tuple[Dict[str, Any], ...], Optional[str], bool]] = {}
+# Last-known-good responses, served when the API is failing:
+# key -> (stored_at, logs, pagination_id, has_more)
+_stale_cache: Dict[str, Tuple[float, Tuple[Dict[str, Any], ...], Optional[str], bool]] = {}
+# Identical queries currently being fetched: cache key -> future of the result
+_inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+
+def _cache_key(params: Dict[str, Any]) -> str:
+    """Hash normalized request parameters into a compact cache key."""
+    encoded = json.dumps(params, sort_keys=True).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """Return a cached response if present and not expired."""
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    expires_at, logs, pagination_id, has_more = entry
+    if _monotonic() >= expires_at:
+        del _cache[key]
+        return None
+    return {"logs": list(logs), "pagination_id": pagination_id, "has_more": has_more}
+
+
+def _cache_put(
+    key: str, ttl: float, result: Dict[str, Any], fresh: bool = True
+) -> None:
+    """
+    Store a response, evicting expired and then oldest entries when full.
+
+    The response is always recorded as last-known-good; it is only added to
+    the TTL cache when `fresh` is set and `ttl` is positive. Like the other
+    cache helpers it never awaits, so it runs atomically on the event loop.
+    """
+    now = _monotonic()
+    # The line sequence is frozen as a tuple; the line dicts themselves are
+    # shared with callers, who must treat them as read-only
+    entry = (tuple(result["logs"]), result["pagination_id"], result["has_more"])
+    if fresh and ttl > 0:
+        if len(_cache) >= CACHE_MAX_ENTRIES:
+            for stale_key in [k for k, v in _cache.items() if v[0] <= now]:
+                del _cache[stale_key]
+            while len(_cache) >= CACHE_MAX_ENTRIES:
+                del _cache[next(iter(_cache))]
+        _cache[key] = (now + ttl, *entry)
+
+    _stale_cache.pop(key, None)
+    while len(_stale_cache) >= CACHE_MAX_ENTRIES:
+        del _stale_cache[next(iter(_stale_cache))]
+    _stale_cache[key] = (now, *entry)
+
+
+def _stale_get(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the last-known-good response for a query, marked as stale.
+
+    Returns None when there is none or it is older than MAX_STALE_AGE, so the
+    caller raises its original error.
+    """
+    entry = _stale_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, logs, pagination_id, has_more = entry
+    age = _monotonic() - stored_at
+    if age >= MAX_STALE_AGE:
+        return None
+    return {
+        "logs": list(logs),
+        "pagination_id": pagination_id,
+        "has_more": has_more,
+        "stale": True,
+        "stale_age_seconds": round(age, 1),
+    }
+
+
 async def fetch_latest_logs(
     count: int = 10,
     apps: Optional[str] = None,
@@ -201,10 +775,21 @@ async def fetch_latest_logs(
     prefer: Optional[str] = "tail",
     pagination_id: Optional[str] = None,
     correlation_id: Optional[str] = None,
+    use_cache: bool = True,
+    allow_stale_on_error: bool = True,
+    fetch_params: Optional[FetchParams] = None,
 ) -> Dict[str, Any]:
     """
     Fetch logs from Mezmo Export API v2 with enhanced error handling and retry logic.
 
+    Identical queries are served from a short-lived in-process cache:
+    MEZMO_CACHE_TTL seconds for open-ended windows and MEZMO_CACHE_TTL_BOUNDED
+    seconds when both from_ts and to_ts are given. If the API is unavailable
+    (retries exhausted or circuit breaker open), the last successful response
+    for the same query is returned instead of raising, marked with
+    'stale': True. Concurrent identical queries (without pagination_id) share
+    a single API call.
+
     Args:
         count: Number of logs to return (max 10,000, default: 10)
         apps: Comma-separated list of applications
@@ -215,10 +800,21 @@ async def fetch_latest_logs(
         to_ts: End time (UNIX timestamp)
         prefer: 'head' or 'tail' (default: 'tail')
         pagination_id: Token for paginated results
-        correlation_id: Request correlation ID for tracing
+        correlation_id: Request correlation ID for tracing (default: a new
+            "<pid>-<random>-<sequence>" ID from new_correlation_id())
+        use_cache: Serve repeated identical queries from the response cache
+        allow_stale_on_error: Fall back to the last successful response for
+            this query when the API is unavailable
+        fetch_params: Pre-validated parameters; when given, the individual
+            query arguments above are ignored
 
     Returns:
-        Dictionary with 'logs', 'pagination_id', and 'has_more' keys
+        Dictionary with 'logs', 'pagination_id', and 'has_more' keys, plus
+        'stale': True and 'stale_age_seconds' when served from the
+        last-known-good fallback.
+        'has_more' is True exactly when the response carried a pagination_id.
+        The line dicts may be shared with the response cache; treat them
+        as read-only.
 
     Raises:
         MezmoAPIError: When API request fails after retries
@@ -226,9 +822,90 @@ async def fetch_latest_logs(
     """
     # Generate correlation ID if not provided
     if correlation_id is None:
-        correlation_id = str(uuid.uuid4())
+        correlation_id = new_correlation_id()
     log = logger.bind(correlation_id=correlation_id)
 
+    # Fail fast on missing configuration rather than inside the retry loop
+    _get_api_key()
+
+    if fetch_params is None:
+        fetch_params = FetchParams(
+            count=count,
+            apps=apps,
+            hosts=hosts,
+            levels=levels,
+            query=query,
+            from_ts=from_ts,
+            to_ts=to_ts,
+            prefer=prefer,
+            pagination_id=pagination_id,
+        )
+
+    # Serve repeated queries from the cache. The key uses the caller's
+    # parameters (before default timestamps are filled in) so open-ended
+    # "latest logs" queries hit the cache within the TTL window.
+    cache_ttl = CACHE_TTL_BOUNDED if fetch_params.is_bounded else CACHE_TTL
+    cache_key = None
+    if use_cache or allow_stale_on_error:
+        cache_key = _cache_key(asdict(fetch_params))
+    if use_cache and cache_ttl > 0:
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            log.debug("Serving logs from cache", logs_retrieved=len(cached["logs"]))
+            return cached
+
+    fetch = partial(
+        _fetch_uncached, fetch_params, cache_key, cache_ttl, use_cache, allow_stale_on_error, log
+    )
+
+    # Coalesce concurrent identical queries into a single API call. Paginated
+    # requests are never shared since each token must be fetched on its own.
+    if not use_cache or fetch_params.pagination_id is not None:
+        return await fetch()
+
+    inflight = _inflight.get(cache_key)
+    if inflight is not None:
+        try:
+            result = await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            # Only recover from the leader's cancellation, never our own
+            if not inflight.cancelled() or asyncio.current_task().cancelling():
+                raise
+            log.debug("Coalesced Mezmo request was cancelled, fetching directly")
+            return await fetch()
+        log.debug("Joined in-flight Mezmo request", logs_retrieved=len(result["logs"]))
+        # Each follower gets its own list; the leader keeps the original
+        return {**result, "logs": list(result["logs"])}
+
+    inflight = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = inflight
+    try:
+        result = await fetch()
+    except asyncio.CancelledError:
+        inflight.cancel()
+        raise
+    except Exception as e:
+        inflight.set_exception(e)
+        # There may be no followers; don't warn about an unretrieved exception
+        inflight.exception()
+        raise
+    finally:
+        if _inflight.get(cache_key) is inflight:
+            del _inflight[cache_key]
+
+    inflight.set_result(result)
+    return result
+
+
+async def _fetch_uncached(
+    fetch_params: FetchParams,
+    cache_key: Optional[str],
+    cache_ttl: float,
+    use_cache: bool,
+    allow_stale_on_error: bool,
+    log: Any,
+) -> Dict[str, Any]:
+    """Call the export API behind the circuit breaker, with retries and stale fallback."""
     # Check circuit breaker before proceeding
     if not await _circuit_breaker.can_proceed():
         cb_state = _circuit_breaker.get_state()
@@ -236,185 +913,143 @@ async def fetch_latest_logs(
             "Circuit breaker is OPEN, rejecting request",
             circuit_breaker_state=cb_state,
         )
+        if allow_stale_on_error:
+            stale = _stale_get(cache_key)
+            if stale is not None:
+                log.warning(
+                    "Serving stale logs while circuit breaker is OPEN",
+                    stale_age_seconds=stale["stale_age_seconds"],
+                )
+                return stale
         raise MezmoAPIError(
             "Circuit breaker OPEN - Mezmo API unavailable. "
             f"Service will retry automatically after {CIRCUIT_BREAKER_RECOVERY_TIMEOUT}s. "
             "Too many recent failures indicate the API is experiencing issues.",
             status_code=503,
         )
-    # Validate parameters per Mezmo Export API v2 spec
-    if count < 1 or count > 10000:
-        raise ValueError(f"Count must be between 1 and 10,000 per API spec, got {count}")
-
-    if prefer not in ["head", "tail"]:
-        raise ValueError(f"Prefer must be 'head' or 'tail', got {prefer}")
-
     # Build request parameters
-    url = f"{MEZMO_API_BASE_URL}/v2/export"
+    params = fetch_params.to_query(int(time.time()))
 
-    # Mezmo API requires both from and to timestamps IN SECONDS
-    # Provide sensible defaults if not specified
-    now = int(time.time())
-    if from_ts is None:
-        # Default to 6 hours ago - balance between quota and finding actual logs
-        from_ts = str(now - 21600)  # 6 hours in seconds
-    if to_ts is None:
-        # Default to now
-        to_ts = str(now)  # UNIX timestamp in seconds
-
-    # Map to Mezmo API v2 parameters
-    params = {
-        "size": count,  # API uses 'size', we expose as 'count'
-        "prefer": prefer,
-        "from": from_ts,
-        "to": to_ts,
-    }
+    # Encode the query string once; it's reused across retry attempts.
+    # The path is resolved against the client's base_url.
+    request_url = f"{_EXPORT_PATH}?{_encode_query(tuple(params.items()))}"
 
-    # Add optional parameters
-    if apps:
-        params["apps"] = apps
-    if hosts:
-        params["hosts"] = hosts
-    if levels:
-        params["levels"] = levels
-    # NOTE: Do not set default levels - let Mezmo return all levels if not specified
-    if query:
-        params["query"] = query
-    if pagination_id:
-        params["pagination_id"] = pagination_id
-
-    headers = {"servicekey": MEZMO_API_KEY}
-
-    # Log the request
-    log.info(
+    # Log the request (debug only; the outcome is logged once below)
+    log.debug(
         "Making request to Mezmo API",
-        url=url,
-        params={k: v for k, v in params.items() if k != "servicekey"},
-        count=count,
-        prefer=prefer,
+        path=_EXPORT_PATH,
+        params=params,
+        count=fetch_params.count,
+        prefer=fetch_params.prefer,
     )
 
     # Retry logic with exponential backoff
     last_exception = None
 
     for attempt in range(MAX_RETRIES):
+        retry_after_seconds: Optional[int] = None
+        client: Optional[httpx.AsyncClient] = None
         try:
-            async with get_http_client() as client:
-                start_time = time.time()
+            await _rate_limiter.acquire()
+            async with _request_limiter:
+                # Fetched only once a slot is held: the pool may have been
+                # rebuilt while this request was queued
+                client = await get_http_client()
+                start_time = _perf()
+                response = await client.get(request_url)
+
+            request_duration = _perf() - start_time
+            _request_limiter.record(response.status_code, request_duration)
+            _rate_limiter.observe(response)
+
+            _reset_connect_failures()
+
+            # Handle successful response
+            if response.status_code == 200:
+                try:
+                    # orjson decodes straight from bytes, skipping the str copy
+                    data = orjson.loads(response.content)
+                    logs = data.get("lines", [])
+
+                    log.info(
+                        "Successfully retrieved logs from Mezmo",
+                        status_code=response.status_code,
+                        duration_seconds=round(request_duration, 3),
+                        logs_retrieved=len(logs),
+                        attempt=attempt + 1,
+                    )
 
-                response = await client.get(url, headers=headers, params=params)
+                    # Record success for circuit breaker
+                    await _circuit_breaker.record_success()
+
+                    # Return structured response with metadata
+                    # Mezmo returns a pagination_id only when another page exists
+                    pagination_id = data.get("pagination_id")
+                    result = {
+                        "logs": logs,
+                        "pagination_id": pagination_id,
+                        "has_more": bool(pagination_id),
+                    }
+                    if cache_key is not None:
+                        _cache_put(cache_key, cache_ttl, result, fresh=use_cache)
+                    return result
+
+                except Exception as e:
+                    response_text = _response_snippet(response)
+                    log.error(
+                        "Failed to parse Mezmo API response",
+                        error=str(e),
+                        response_text=response_text,
+                    )
+                    await _circuit_breaker.record_failure()
+                    raise MezmoAPIError(
+                        f"Failed to parse Mezmo API response: {e}",
+                        status_code=response.status_code,
+                        response_text=response_text,
+                    )
 
-                request_duration = time.time() - start_time
+            # Handle HTTP errors
+            else:
+                error_msg = f"Mezmo API returned status {response.status_code}"
+                response_text = _response_snippet(response) or "No response body"
 
-                log.info(
-                    "Mezmo API request completed",
+                log.warning(
+                    "Mezmo API request failed",
                     status_code=response.status_code,
                     duration_seconds=round(request_duration, 3),
+                    response_text=response_text,
                     attempt=attempt + 1,
                 )
 
-                # Handle successful response
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        logs = data.get("lines", [])
-
-                        log.info(
-                            "Successfully retrieved logs from Mezmo",
-                            logs_retrieved=len(logs),
-                            total_duration=round(request_duration, 3),
-                        )
-
-                        # Record success for circuit breaker
-                        await _circuit_breaker.record_success()
-
-                        # Return structured response with metadata
-                        return {
-                            "logs": logs,
-                            "pagination_id": data.get("pagination_id"),
-                            "has_more": len(logs) == count,
-                        }
-
-                    except Exception as e:
-                        log.error(
-                            "Failed to parse Mezmo API response",
-                            error=str(e),
-                            response_text=response.text[:500],
-                        )
-                        await _circuit_breaker.record_failure()
-                        raise MezmoAPIError(
-                            f"Failed to parse Mezmo API response: {e}",
-                            status_code=response.status_code,
-                            response_text=response.text[:500],
-                        )
-
-                # Handle HTTP errors
-                else:
-                    error_msg = f"Mezmo API returned status {response.status_code}"
-                    response_text = (
-                        response.text[:500] if response.text else "No response body"
+                # Handle rate limiting (429) with Retry-After header
+                if response.status_code == 429:
+                    # Honor the server's Retry-After hint (seconds or HTTP-date)
+                    retry_after_seconds = _parse_retry_after(response.headers.get("Retry-After"))
+                    if retry_after_seconds is not None:
+                        _rate_limiter.pause(retry_after_seconds)
+
+                    last_exception = MezmoAPIError(
+                        f"{error_msg}: {response_text}",
+                        status_code=response.status_code,
+                        response_text=response_text,
+                        retry_after=retry_after_seconds,
                     )
 
-                    log.warning(
-                        "Mezmo API request failed",
+                # Don't retry on other client errors (4xx except 429)
+                elif 400 <= response.status_code < 500:
+                    raise MezmoAPIError(
+                        f"{error_msg}: {response_text}",
                         status_code=response.status_code,
                         response_text=response_text,
-                        attempt=attempt + 1,
                     )
 
-                    # Handle rate limiting (429) with Retry-After header
-                    if response.status_code == 429:
-                        # Extract Retry-After header if present
-                        retry_after_header = response.headers.get("Retry-After")
-                        retry_after_seconds = None
-                        if retry_after_header:
-                            try:
-                                retry_after_seconds = int(retry_after_header)
-                            except ValueError:
-                                retry_after_seconds = None
-
-                        last_exception = MezmoAPIError(
-                            f"{error_msg}: {response_text}",
-                            status_code=response.status_code,
-                            response_text=response_text,
-                            retry_after=retry_after_seconds,
-                        )
-
-                        # Use Retry-After if provided, otherwise use exponential backoff
-                        if attempt < MAX_RETRIES - 1:
-                            if retry_after_seconds is not None:
-                                rate_limit_delay = retry_after_seconds + random.uniform(0.5, 2.0)
-                            else:
-                                # Capped exponential backoff: 2^attempt instead of 3^attempt
-                                rate_limit_delay = min(
-                                    RETRY_DELAY * (2 ** attempt) + random.uniform(1, 3),
-                                    MAX_RETRY_DELAY
-                                )
-
-                            log.info(
-                                "Rate limited, waiting before retry",
-                                delay_seconds=round(rate_limit_delay, 1),
-                                retry_after_header=retry_after_header,
-                                attempt=attempt + 1,
-                            )
-                            await asyncio.sleep(rate_limit_delay)
-                            continue
-
-                    # Don't retry on other client errors (4xx except 429)
-                    elif 400 <= response.status_code < 500:
-                        raise MezmoAPIError(
-                            f"{error_msg}: {response_text}",
-                            status_code=response.status_code,
-                            response_text=response_text,
-                        )
-
-                    # Retry on server errors (5xx) and other issues
-                    else:
-                        last_exception = MezmoAPIError(
-                            f"{error_msg}: {response_text}",
-                            status_code=response.status_code,
-                            response_text=response_text,
-                        )
+                # Retry on server errors (5xx) and other issues
+                else:
+                    last_exception = MezmoAPIError(
+                        f"{error_msg}: {response_text}",
+                        status_code=response.status_code,
+                        response_text=response_text,
+                    )
 
         except httpx.TimeoutException as e:
             error_msg = f"Request to Mezmo API timed out after {REQUEST_TIMEOUT}s"
@@ -425,6 +1060,9 @@ async def fetch_latest_logs(
                 error=str(e),
             )
             last_exception = MezmoAPIError(error_msg)
+            # Pool exhaustion means every connection is stuck; count it toward a rebuild
+            if isinstance(e, httpx.PoolTimeout):
+                await _record_connect_failure()
 
         except httpx.ConnectError as e:
             error_msg = f"Failed to connect to Mezmo API: {e}"
@@ -434,49 +1072,191 @@ async def fetch_latest_logs(
                 error=str(e),
             )
             last_exception = MezmoAPIError(error_msg)
+            await _record_connect_failure()
 
-        except MezmoAPIError:
-            # Re-raise MezmoAPIError without wrapping
-            raise
-
-        except Exception as e:
-            error_msg = f"Unexpected error calling Mezmo API: {e}"
-            log.error(
-                "Unexpected error in Mezmo API call",
+        except (httpx.ReadError, httpx.WriteError, httpx.RemoteProtocolError) as e:
+            # Connection dropped mid-request: transient, safe to retry a GET
+            error_msg = f"Connection to Mezmo API failed: {e}"
+            log.warning(
+                "Mezmo API transport error",
                 attempt=attempt + 1,
                 error=str(e),
                 error_type=type(e).__name__,
             )
             last_exception = MezmoAPIError(error_msg)
 
-        # Wait before retrying (with exponential backoff) - skip if 429 already handled
-        if attempt < MAX_RETRIES - 1 and (
-            not last_exception or last_exception.status_code != 429
-        ):
-            delay = min(RETRY_DELAY * (2 ** attempt) + random.uniform(0.1, 0.5), MAX_RETRY_DELAY)
+        except MezmoAPIError:
+            # Re-raise MezmoAPIError without wrapping
+            raise
+
+        except Exception as e:
+            if client is not None and client.is_closed:
+                # The shared client was closed under this request (rebuilt
+                # after connection failures); the next attempt gets a new one
+                error_msg = f"Connection to Mezmo API failed: {e}"
+                log.warning(
+                    "Mezmo API client closed mid-request",
+                    attempt=attempt + 1,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                last_exception = MezmoAPIError(error_msg)
+            else:
+                # Not a known transient failure - retrying won't help
+                error_msg = f"Unexpected error calling Mezmo API: {e}"
+                log.error(
+                    "Unexpected error in Mezmo API call",
+                    attempt=attempt + 1,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                raise MezmoAPIError(error_msg) from e
+
+        # Every 5xx or transport failure counts toward the breaker threshold.
+        # Rate limiting says nothing about API health, so 429s don't.
+        if last_exception is not None and last_exception.status_code != 429:
+            await _circuit_breaker.record_failure()
+            if not await _circuit_breaker.can_proceed():
+                log.warning("Circuit breaker opened, abandoning remaining retries")
+                break
+
+        # Wait before retrying: the server's Retry-After hint if it sent one,
+        # exponential backoff otherwise
+        if attempt < MAX_RETRIES - 1:
+            delay = _compute_backoff(attempt, retry_after_seconds)
             log.info(
                 "Retrying Mezmo API request",
                 attempt=attempt + 1,
                 max_retries=MAX_RETRIES,
                 delay_seconds=round(delay, 1),
+                retry_after_seconds=retry_after_seconds,
             )
             await asyncio.sleep(delay)
 
-    # All retries exhausted - record failure for circuit breaker
-    await _circuit_breaker.record_failure()
-
     log.error(
         "All Mezmo API retry attempts failed",
         max_retries=MAX_RETRIES,
         last_error=str(last_exception),
     )
 
+    if allow_stale_on_error:
+        stale = _stale_get(cache_key)
+        if stale is not None:
+            log.warning(
+                "Serving stale logs after Mezmo API failure",
+                last_error=str(last_exception),
+                stale_age_seconds=stale["stale_age_seconds"],
+            )
+            return stale
+
     if last_exception:
         raise last_exception
     else:
         raise MezmoAPIError("Failed to fetch logs from Mezmo after all retry attempts")
 
 
+async def fetch_logs_batch(
+    queries: List[Dict[str, Any]],
+) -> List[Union[Dict[str, Any], BaseException]]:
+    """
+    Run several fetch_latest_logs queries concurrently.
+
+    Requests share the pooled HTTP client and queue in the same adaptive
+    concurrency limiter as every other call, so a large batch can't
+    oversubscribe the API and backs off with everything else on 429s.
+
+    Args:
+        queries: List of keyword-argument dicts for fetch_latest_logs
+
+    Returns:
+        One entry per query, in order: the fetch_latest_logs result dict, or
+        the exception raised for that query
+    """
+    return await asyncio.gather(
+        *(fetch_latest_logs(**query) for query in queries),
+        return_exceptions=True,
+    )
+
+
+async def iter_logs(
+    count: int = 10,
+    apps: Optional[str] = None,
+    hosts: Optional[str] = None,
+    levels: Optional[str] = None,
+    query: Optional[str] = None,
+    from_ts: Optional[str] = None,
+    to_ts: Optional[str] = None,
+    prefer: Optional[str] = "tail",
+    max_pages: Optional[int] = None,
+    correlation_id: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterate over log lines across pages, following pagination_id automatically.
+
+    The next page is requested in the background as soon as the current one
+    arrives, so network time for page N+1 overlaps with the caller
+    processing page N.
+
+    Args:
+        count: Page size (max 10,000, default: 10)
+        apps: Comma-separated list of applications
+        hosts: Comma-separated list of hosts
+        levels: Comma-separated list of log levels
+        query: Search query
+        from_ts: Start time (UNIX timestamp, default: 6 hours ago)
+        to_ts: End time (UNIX timestamp, default: now)
+        prefer: 'head' or 'tail' (default: 'tail')
+        max_pages: Stop after this many pages (default: no limit)
+        correlation_id: Request correlation ID for tracing
+
+    Yields:
+        Individual log entries
+    """
+    # Pin the time window so every page belongs to the same query
+    now = int(time.time())
+    fetch_params = FetchParams(
+        count=count,
+        apps=apps,
+        hosts=hosts,
+        levels=levels,
+        query=query,
+        from_ts=from_ts if from_ts is not None else str(now - DEFAULT_TIME_WINDOW_SECONDS),
+        to_ts=to_ts if to_ts is not None else str(now),
+        prefer=prefer,
+    )
+
+    pending: Optional[asyncio.Task] = asyncio.create_task(
+        fetch_latest_logs(fetch_params=fetch_params, correlation_id=correlation_id)
+    )
+    pages = 0
+    try:
+        while pending is not None:
+            result = await pending
+            pending = None
+            pages += 1
+
+            # Prefetch the next page before handing this one to the caller
+            next_id = result.get("pagination_id")
+            if next_id and (max_pages is None or pages < max_pages):
+                pending = asyncio.create_task(
+                    fetch_latest_logs(
+                        fetch_params=replace(fetch_params, pagination_id=next_id),
+                        correlation_id=correlation_id,
+                    )
+                )
+
+            for line in result["logs"]:
+                yield line
+    finally:
+        # Caller stopped early: don't leave a prefetch running or unobserved
+        if pending is not None:
+            if pending.done():
+                if not pending.cancelled():
+                    pending.exception()
+            else:
+                pending.cancel()
+
+
 async def test_mezmo_connection() -> Dict[str, Any]:
     """
     Test connectivity to the Mezmo API.
@@ -487,9 +1267,13 @@ async def test_mezmo_connection() -> Dict[str, Any]:
     try:
         logger.info("Testing Mezmo API connectivity")
 
-        # Try to fetch a small number of logs to test the connection
-        # The function now provides default timestamps automatically
-        result_data = await fetch_latest_logs(count=1)
+        # Try to fetch a small number of logs to test the connection. The
+        # deadline covers the whole test, including retries and backoff. A
+        # probe must reach the API, so cached and stale results are off.
+        async with asyncio.timeout(10):
+            result_data = await fetch_latest_logs(
+                count=1, use_cache=False, allow_stale_on_error=False
+            )
         logs = result_data.get("logs", [])
 
         result = {
@@ -517,6 +1301,38 @@ def get_circuit_breaker_state() -> Dict[str, Any]:
     return _circuit_breaker.get_state()
 
 
+def get_concurrency_state() -> Dict[str, Any]:
+    """Get current request concurrency limiter state for monitoring."""
+    return _request_limiter.get_state()
+
+
+def get_rate_limit_state() -> Dict[str, Any]:
+    """Get current requests-per-minute limiter state for monitoring."""
+    return _rate_limiter.get_state()
+
+
+async def startup() -> None:
+    """Create the shared HTTP client up front so requests never take the lazy-init path."""
+    await get_http_client()
+
+
+async def warmup() -> None:
+    """
+    Open a connection to the Mezmo API ahead of the first real request.
+
+    Issues a HEAD against the base URL so the TLS handshake is paid at startup
+    without spending export quota. Bounded by the connect timeout, since only
+    the connection is wanted; failures are logged and ignored.
+    """
+    try:
+        client = await get_http_client()
+        async with asyncio.timeout(CONNECT_TIMEOUT):
+            await client.head("/")
+        logger.info("Mezmo API connection warmed up")
+    except Exception as e:
+        logger.warning("Mezmo API warmup failed", error=str(e), error_type=type(e).__name__)
+
+
 # Cleanup function for graceful shutdown
 async def cleanup():
     """Clean up resources"""
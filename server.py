@@ -7,26 +7,43 @@ with comprehensive error handling, authentication, health checks, and observabil
 """
 
 import argparse
+import asyncio
+import collections
 import logging
 import os
+import queue
 import re
 import sys
 import time
-import uuid
+from contextlib import asynccontextmanager, nullcontext, suppress
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Any, Optional
 
+import orjson
 import structlog
+from structlog.contextvars import bound_contextvars
 from fastmcp import FastMCP, Context
 from fastmcp.exceptions import ToolError
-from pydantic import BaseModel, Field, field_validator
-from prometheus_client import Counter, Histogram, Gauge, start_http_server
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 from dotenv import load_dotenv
 
-from mezmo_api import fetch_latest_logs, MezmoAPIError, get_circuit_breaker_state
-
-# Load environment variables
+# Load environment variables once, before mezmo_api reads its configuration
 load_dotenv()
 
+from mezmo_api import (  # noqa: E402
+    DEFAULT_TIME_WINDOW_SECONDS,
+    fetch_latest_logs,
+    MezmoAPIError,
+    get_circuit_breaker_state,
+    get_concurrency_state,
+    get_rate_limit_state,
+    new_correlation_id,
+    startup,
+    warmup,
+    cleanup,
+)
+
 # Configuration with environment variables and defaults
 SERVER_NAME = os.getenv("MCP_SERVER_NAME", "Mezmo MCP Server")
 SERVER_HOST = os.getenv("MCP_SERVER_HOST", "0.0.0.0")
@@ -34,8 +51,11 @@ SERVER_PORT = int(os.getenv("MCP_SERVER_PORT", "18080"))
 LOG_LEVEL = os.getenv("MCP_LOG_LEVEL", "INFO")
 ENABLE_METRICS = os.getenv("MCP_ENABLE_METRICS", "true").lower() == "true"
 METRICS_PORT = int(os.getenv("MCP_METRICS_PORT", "9090"))
+METRICS_HOST = os.getenv("MCP_METRICS_HOST", "0.0.0.0")
 ENABLE_AUTH = os.getenv("MCP_ENABLE_AUTH", "false").lower() == "true"
 API_TOKEN = os.getenv("MCP_API_TOKEN")
+VERBOSE_PROGRESS = os.getenv("MCP_VERBOSE_PROGRESS", "false").lower() == "true"
+MAX_CONCURRENT_TOOL_CALLS = int(os.getenv("MCP_MAX_CONCURRENT_TOOL_CALLS", "100"))
 
 # Mezmo API Configuration
 MEZMO_API_KEY = os.getenv("MEZMO_API_KEY")
@@ -50,10 +70,17 @@ if ENABLE_AUTH and not API_TOKEN:
         "MCP_API_TOKEN environment variable is required when authentication is enabled"
     )
 
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """JSON serializer for structlog; orjson returns bytes, stdlib logging wants str."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
 # Configure structured logging
 structlog.configure(
     processors=[
         structlog.stdlib.filter_by_level,
+        structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
@@ -61,7 +88,7 @@ structlog.configure(
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer(),
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps),
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -71,34 +98,120 @@ structlog.configure(
 
 logger = structlog.get_logger(__name__)
 
-# Prometheus metrics
+
+class _NullMetric:
+    """Stand-in for a Prometheus metric or label child when metrics are disabled."""
+
+    __slots__ = ()
+
+    def labels(self, **labels):
+        return self
+
+    def inc(self, amount=1):
+        pass
+
+    def observe(self, amount):
+        pass
+
+    def time(self):
+        return nullcontext()
+
+    def track_inprogress(self):
+        return nullcontext()
+
+
+# Prometheus metrics. prometheus_client is only imported when metrics are on;
+# otherwise every metric is a no-op so tool bodies never branch on the flag.
 if ENABLE_METRICS:
+    from prometheus_client import (
+        Counter,
+        Gauge,
+        Histogram,
+        REGISTRY,
+        GC_COLLECTOR,
+        PLATFORM_COLLECTOR,
+        PROCESS_COLLECTOR,
+    )
+
+    # Only export this server's own metrics; the default process/platform/GC
+    # collectors dominate scrape size and cost for a small sidecar
+    for _collector in (PROCESS_COLLECTOR, PLATFORM_COLLECTOR, GC_COLLECTOR):
+        REGISTRY.unregister(_collector)
+
     REQUEST_COUNT = Counter(
         "mezmo_mcp_requests_total", "Total MCP requests", ["tool_name", "status"]
     )
+    # Buckets sized for Mezmo round trips (roughly 100ms-5s, up to the 30s timeout)
     REQUEST_LATENCY = Histogram(
-        "mezmo_mcp_request_duration_seconds", "MCP request latency", ["tool_name"]
-    )
-    ACTIVE_CONNECTIONS = Gauge(
-        "mezmo_mcp_active_connections", "Number of active MCP connections"
+        "mezmo_mcp_request_duration_seconds",
+        "MCP request latency",
+        ["tool_name"],
+        buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0),
     )
     LOGS_FETCHED = Counter(
         "mezmo_mcp_logs_fetched_total", "Total logs fetched from Mezmo API"
     )
+    TOOL_CALLS_IN_FLIGHT = Gauge(
+        "mezmo_mcp_tool_calls_in_flight", "Tool calls currently admitted and running"
+    )
+
+    # Read at scrape time so it always reflects the limiter's current value
+    Gauge(
+        "mezmo_mcp_upstream_concurrency_limit",
+        "Adaptive limit on concurrent Mezmo API requests",
+    ).set_function(lambda: get_concurrency_state()["limit"])
+    # Only exported with a budget configured; a disabled limiter would read as
+    # an exhausted one
+    if get_rate_limit_state()["rpm"] > 0:
+        Gauge(
+            "mezmo_mcp_upstream_rpm_remaining",
+            "Requests left in the current per-minute budget for the Mezmo API",
+        ).set_function(lambda: get_rate_limit_state()["remaining"])
+else:
+    REQUEST_COUNT = REQUEST_LATENCY = LOGS_FETCHED = TOOL_CALLS_IN_FLIGHT = _NullMetric()
+
+# Pre-bound label children so tool bodies skip the per-call label lookup
+_GET_LOGS_SUCCESS = REQUEST_COUNT.labels(tool_name="get_logs", status="success")
+_GET_LOGS_ERROR = REQUEST_COUNT.labels(tool_name="get_logs", status="error")
+_GET_LOGS_RATE_LIMITED = REQUEST_COUNT.labels(tool_name="get_logs", status="rate_limited")
+_GET_LOGS_CIRCUIT_OPEN = REQUEST_COUNT.labels(tool_name="get_logs", status="circuit_breaker_open")
+_GET_LOGS_VALIDATION_ERROR = REQUEST_COUNT.labels(tool_name="get_logs", status="validation_error")
+_GET_LOGS_LATENCY = REQUEST_LATENCY.labels(tool_name="get_logs")
+# Mezmo status codes with their own get_logs status label; others count as "error"
+_GET_LOGS_ERROR_BY_STATUS = {429: _GET_LOGS_RATE_LIMITED, 503: _GET_LOGS_CIRCUIT_OPEN}
+
+_LIST_APPS_SUCCESS = REQUEST_COUNT.labels(tool_name="list_apps", status="success")
+_LIST_APPS_ERROR = REQUEST_COUNT.labels(tool_name="list_apps", status="error")
+_LIST_APPS_LATENCY = REQUEST_LATENCY.labels(tool_name="list_apps")
+
+_LOG_STATS_SUCCESS = REQUEST_COUNT.labels(tool_name="get_log_stats", status="success")
+_LOG_STATS_ERROR = REQUEST_COUNT.labels(tool_name="get_log_stats", status="error")
+_LOG_STATS_LATENCY = REQUEST_LATENCY.labels(tool_name="get_log_stats")
 
 
 # Valid log levels per Mezmo API
-VALID_LOG_LEVELS = {"DEBUG", "INFO", "NOTICE", "WARNING", "ERROR", "CRITICAL", "ALERT", "EMERGENCY"}
+VALID_LOG_LEVELS = frozenset(
+    {"DEBUG", "INFO", "NOTICE", "WARNING", "ERROR", "CRITICAL", "ALERT", "EMERGENCY"}
+)
+_VALID_LEVELS_MSG = f"Valid levels: {sorted(VALID_LOG_LEVELS)}"
+
+# Timestamps further ahead than this (10 years) are rejected as nonsense
+_MAX_FUTURE_TS_DELTA = 315_360_000
 
 # Pattern for valid identifiers (app names, host names)
 # Allows: alphanumeric, underscores, dots, hyphens, and brackets (for Heroku-style names like app[mcp])
 IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z0-9_.\-\[\]]+$")
+# Whole normalized list in one pass; items are only checked individually to
+# build the error message
+_CSV_IDENTIFIERS_PATTERN = re.compile(r"[a-zA-Z0-9_.\-\[\]]+(?:,[a-zA-Z0-9_.\-\[\]]+)*")
 
 
 # Pydantic models for request validation
 class LogsRequest(BaseModel):
     """Request model for get_logs tool with validation"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     count: int = Field(
         default=10, ge=1, le=10000, description="Number of logs to return"
     )
@@ -134,18 +247,15 @@ class LogsRequest(BaseModel):
         if not items:
             raise ValueError("Cannot be empty after parsing")
 
-        invalid_items = []
-        for item in items:
-            if not IDENTIFIER_PATTERN.match(item):
-                invalid_items.append(item)
-
-        if invalid_items:
-            raise ValueError(
-                f"Invalid identifier(s): {invalid_items}. "
-                "Identifiers must contain only alphanumeric characters, underscores, dots, hyphens, and brackets."
-            )
+        normalized = ",".join(items)
+        if _CSV_IDENTIFIERS_PATTERN.fullmatch(normalized):
+            return normalized
 
-        return ",".join(items)  # Return normalized version
+        invalid_items = [item for item in items if not IDENTIFIER_PATTERN.match(item)]
+        raise ValueError(
+            f"Invalid identifier(s): {invalid_items}. "
+            "Identifiers must contain only alphanumeric characters, underscores, dots, hyphens, and brackets."
+        )
 
     @field_validator("levels")
     @classmethod
@@ -161,8 +271,7 @@ class LogsRequest(BaseModel):
         invalid_levels = set(items) - VALID_LOG_LEVELS
         if invalid_levels:
             raise ValueError(
-                f"Invalid log level(s): {invalid_levels}. "
-                f"Valid levels: {sorted(VALID_LOG_LEVELS)}"
+                f"Invalid log level(s): {invalid_levels}. {_VALID_LEVELS_MSG}"
             )
 
         return ",".join(items)  # Return normalized (uppercase) version
@@ -179,7 +288,7 @@ class LogsRequest(BaseModel):
             if ts < 0:
                 raise ValueError("Timestamp must be positive")
             # Sanity check: reject timestamps obviously in the future (> 10 years from now)
-            if ts > time.time() + 315360000:  # 10 years in seconds
+            if ts > time.time() + _MAX_FUTURE_TS_DELTA:
                 raise ValueError("Timestamp appears to be too far in the future")
         except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid timestamp: {v}. Must be a UNIX timestamp in seconds. {e}")
@@ -187,6 +296,46 @@ class LogsRequest(BaseModel):
         return v
 
 
+def _field_constraint(field_name: str, constraint: str) -> Any:
+    """Read a constraint (ge, le, pattern, ...) declared on a LogsRequest field."""
+    for item in LogsRequest.model_fields[field_name].metadata:
+        value = getattr(item, constraint, None)
+        if value is not None:
+            return value
+    raise LookupError(f"LogsRequest.{field_name} declares no {constraint} constraint")
+
+
+# Taken from the LogsRequest field declarations so the fast path below cannot
+# drift from what full validation enforces
+_COUNT_MIN = _field_constraint("count", "ge")
+_COUNT_MAX = _field_constraint("count", "le")
+_PREFER_PATTERN = re.compile(_field_constraint("prefer", "pattern"))
+
+
+def _unfiltered_logs_request(
+    count: Any, prefer: Any, pagination_id: Any
+) -> Optional[LogsRequest]:
+    """
+    Build a LogsRequest without running validation, for calls with no filters.
+
+    With every filter and timestamp unset, only count, prefer and
+    pagination_id need checking, and none of them are normalized. Returns None
+    when any check fails so the caller can fall back to full validation and
+    report the error.
+    """
+    if (
+        type(count) is int
+        and _COUNT_MIN <= count <= _COUNT_MAX
+        and type(prefer) is str
+        and _PREFER_PATTERN.fullmatch(prefer) is not None
+        and (pagination_id is None or type(pagination_id) is str)
+    ):
+        return LogsRequest.model_construct(
+            count=count, prefer=prefer, pagination_id=pagination_id
+        )
+    return None
+
+
 class HealthResponse(BaseModel):
     """Health check response model"""
 
@@ -196,77 +345,155 @@ class HealthResponse(BaseModel):
     dependencies: Dict[str, str] = {}
 
 
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO-8601 with millisecond precision."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+# The healthy payload only varies by timestamp, so it's serialized once with a
+# %s placeholder and formatted per request
+_HEALTHY_TEMPLATE = orjson.dumps(
+    HealthResponse(
+        status="healthy",
+        timestamp="%s",
+        dependencies={
+            "mezmo_api": "available",
+            "metrics": "enabled" if ENABLE_METRICS else "disabled",
+            "auth": "enabled" if ENABLE_AUTH else "disabled",
+        },
+    ).model_dump()
+).decode()
+
+# Last rendered healthy payload as (monotonic time, payload)
+_HEALTH_CACHE_TTL = 1.0
+_health_cache = (float("-inf"), "")
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Create and warm the Mezmo client on startup and release it on shutdown."""
+    await startup()
+    # Warm up in the background so serving doesn't wait on a slow Mezmo API
+    warmup_task = asyncio.create_task(warmup())
+    try:
+        yield
+    finally:
+        warmup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup_task
+        await cleanup()
+
+
 # Create FastMCP server
-mcp = FastMCP(name=SERVER_NAME)
+mcp = FastMCP(name=SERVER_NAME, lifespan=lifespan)
+
+
+def _rate_limited_message(error: MezmoAPIError, request_data: "LogsRequest") -> str:
+    """Message for a 429 from Mezmo."""
+    if error.retry_after:
+        retry_info = f"The API suggests waiting {error.retry_after} seconds before retrying.\n"
+    else:
+        retry_info = "Wait 30-60 seconds before trying again.\n"
+
+    return (
+        f"Mezmo API Rate Limited: {error.message}\n\n"
+        f"{retry_info}"
+        "Suggestions to reduce API load:\n"
+        f"1. You requested count={request_data.count}. Try reducing to count=3 or count=5.\n"
+        "2. Add an app filter (apps='your-app') to drastically reduce volume.\n"
+        "3. Add a levels filter (levels='ERROR,WARNING') to focus on important logs.\n"
+        "4. Avoid making multiple concurrent requests."
+    )
+
+
+def _circuit_open_message(error: MezmoAPIError, request_data: "LogsRequest") -> str:
+    """Message for a 503 raised while the circuit breaker is open."""
+    cb_state = get_circuit_breaker_state()
+    return (
+        f"Mezmo API Unavailable: {error.message}\n\n"
+        f"The service has experienced {cb_state['failure_count']} recent failures.\n"
+        f"Automatic recovery will be attempted in {cb_state['recovery_timeout']} seconds.\n"
+        "This is a temporary protection mechanism to prevent cascading failures."
+    )
+
+
+def _auth_failed_message(error: MezmoAPIError, request_data: "LogsRequest") -> str:
+    """Message for a 401 from Mezmo."""
+    return (
+        f"Authentication Failed: {error.message}\n\n"
+        "The Mezmo API key may be invalid or expired.\n"
+        "Please verify the MEZMO_API_KEY environment variable is set correctly."
+    )
+
+
+def _bad_request_message(error: MezmoAPIError, request_data: "LogsRequest") -> str:
+    """Message for a 400 from Mezmo, echoing the filters that were sent."""
+    return (
+        f"Invalid Request: {error.message}\n\n"
+        "The request parameters may be malformed. Check:\n"
+        f"- apps: {request_data.apps}\n"
+        f"- hosts: {request_data.hosts}\n"
+        f"- levels: {request_data.levels}\n"
+        f"- query: {request_data.query}\n"
+        f"- from_ts: {request_data.from_ts}\n"
+        f"- to_ts: {request_data.to_ts}"
+    )
+
+
+def _generic_error_message(error: MezmoAPIError, request_data: "LogsRequest") -> str:
+    """Fallback message for any other Mezmo error."""
+    return f"Failed to retrieve logs from Mezmo: {error.message}"
+
+
+_ERROR_MESSAGE_BUILDERS = {
+    429: _rate_limited_message,
+    503: _circuit_open_message,
+    401: _auth_failed_message,
+    400: _bad_request_message,
+}
 
 
 def _build_error_message(error: MezmoAPIError, request_data: "LogsRequest") -> str:
     """Build a helpful error message based on the error type and context."""
-    if error.status_code == 429:
-        # Rate limit error
-        retry_info = ""
-        if error.retry_after:
-            retry_info = f"The API suggests waiting {error.retry_after} seconds before retrying.\n"
-        else:
-            retry_info = "Wait 30-60 seconds before trying again.\n"
-
-        return (
-            f"Mezmo API Rate Limited: {error.message}\n\n"
-            f"{retry_info}"
-            "Suggestions to reduce API load:\n"
-            f"1. You requested count={request_data.count}. Try reducing to count=3 or count=5.\n"
-            "2. Add an app filter (apps='your-app') to drastically reduce volume.\n"
-            "3. Add a levels filter (levels='ERROR,WARNING') to focus on important logs.\n"
-            "4. Avoid making multiple concurrent requests."
-        )
+    builder = _ERROR_MESSAGE_BUILDERS.get(error.status_code, _generic_error_message)
+    return builder(error, request_data)
 
-    elif error.status_code == 503:
-        # Circuit breaker open
-        cb_state = get_circuit_breaker_state()
-        return (
-            f"Mezmo API Unavailable: {error.message}\n\n"
-            f"The service has experienced {cb_state['failure_count']} recent failures.\n"
-            f"Automatic recovery will be attempted in {cb_state['recovery_timeout']} seconds.\n"
-            "This is a temporary protection mechanism to prevent cascading failures."
-        )
 
-    elif error.status_code == 401:
-        return (
-            f"Authentication Failed: {error.message}\n\n"
-            "The Mezmo API key may be invalid or expired.\n"
-            "Please verify the MEZMO_API_KEY environment variable is set correctly."
-        )
+# Admission control for tools that call Mezmo: callers past the limit wait
+# here instead of piling more work onto the shared client
+_tool_call_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
 
-    elif error.status_code == 400:
-        return (
-            f"Invalid Request: {error.message}\n\n"
-            "The request parameters may be malformed. Check:\n"
-            f"- apps: {request_data.apps}\n"
-            f"- hosts: {request_data.hosts}\n"
-            f"- levels: {request_data.levels}\n"
-            f"- query: {request_data.query}\n"
-            f"- from_ts: {request_data.from_ts}\n"
-            f"- to_ts: {request_data.to_ts}"
-        )
 
-    else:
-        return f"Failed to retrieve logs from Mezmo: {error.message}"
+@asynccontextmanager
+async def _tool_call_slot():
+    """Hold one of the MCP_MAX_CONCURRENT_TOOL_CALLS slots for a tool call."""
+    async with _tool_call_semaphore:
+        with TOOL_CALLS_IN_FLIGHT.track_inprogress():
+            yield
 
 
 # Initialize startup tasks
+_metrics_started = False
+
+
 def initialize_server():
     """Initialize server components"""
+    global _metrics_started
+
     logger.info(
         "Starting Mezmo MCP Server",
         server_name=SERVER_NAME,
     )
 
-    # Start metrics server if enabled
-    if ENABLE_METRICS:
+    # Start metrics server if enabled; only ever bind the port once
+    if ENABLE_METRICS and not _metrics_started:
+        from prometheus_client import start_http_server
+
         try:
-            start_http_server(METRICS_PORT)
-            logger.info("Metrics server started", port=METRICS_PORT)
-        except Exception as e:
+            start_http_server(METRICS_PORT, addr=METRICS_HOST)
+            _metrics_started = True
+            logger.info("Metrics server started", host=METRICS_HOST, port=METRICS_PORT)
+        except OSError as e:
             logger.error("Failed to start metrics server", error=str(e))
 
 
@@ -328,186 +555,193 @@ async def get_logs(
     Raises:
         ToolError: When API request fails or validation errors occur
     """
-    # Validate request using Pydantic model
-    try:
-        request_data = LogsRequest(
-            count=count,
-            apps=apps,
-            hosts=hosts,
-            levels=levels,
-            query=query,
-            from_ts=from_ts,
-            to_ts=to_ts,
-            prefer=prefer,
-            pagination_id=pagination_id,
-        )
-    except Exception as e:
-        logger.error("Invalid request parameters", error=str(e))
-        if ENABLE_METRICS:
-            REQUEST_COUNT.labels(tool_name="get_logs", status="validation_error").inc()
-        raise ToolError(str(e))
-
-    # Log the request with context
-    logger.info(
-        "Processing get_logs request",
-        count=request_data.count,
-        apps=request_data.apps,
-        hosts=request_data.hosts,
-        levels=request_data.levels,
-        query=request_data.query,
-        prefer=request_data.prefer,
-    )
-
-    # Record metrics
-    start_time = time.time()
-    if ENABLE_METRICS:
-        REQUEST_COUNT.labels(tool_name="get_logs", status="started").inc()
-
     # Generate correlation ID for request tracing
-    correlation_id = str(uuid.uuid4())
-
-    try:
-        # Log progress to client
-        await ctx.info(f"Fetching {request_data.count} logs from Mezmo API...")
-
-        # Call the Mezmo API
-        result = await fetch_latest_logs(
-            count=request_data.count,
-            apps=request_data.apps,
-            hosts=request_data.hosts,
-            levels=request_data.levels,
-            query=request_data.query,
-            from_ts=request_data.from_ts,
-            to_ts=request_data.to_ts,
-            prefer=request_data.prefer,
-            pagination_id=request_data.pagination_id,
-            correlation_id=correlation_id,
-        )
-
-        logs = result.get("logs", [])
-
-        # Log success
-        logger.info(
-            "Successfully retrieved logs from Mezmo",
-            logs_count=len(logs),
-            request_count=request_data.count,
-            correlation_id=correlation_id,
-        )
-
-        # Update metrics
-        if ENABLE_METRICS:
-            REQUEST_COUNT.labels(tool_name="get_logs", status="success").inc()
-            LOGS_FETCHED.inc(len(logs))
-            REQUEST_LATENCY.labels(tool_name="get_logs").observe(
-                time.time() - start_time
-            )
-
-        # Provide guidance for empty results
-        if len(logs) == 0:
-            await ctx.info(
-                "No logs found. Suggestions:\n"
-                "1. Expand time range (from_ts further back)\n"
-                "2. Remove filters to discover available apps\n"
-                "3. Check app names with list_apps tool"
-            )
-        else:
-            # Notify client of completion
-            await ctx.info(f"Successfully retrieved {len(logs)} logs")
-
-        # Build time range for metadata
-        now = int(time.time())
-        from_ts_value = request_data.from_ts or str(now - 21600)
-        to_ts_value = request_data.to_ts or str(now)
-
-        # Return structured response with metadata
-        return {
-            "logs": logs,
-            "metadata": {
-                "count": len(logs),
-                "requested_count": request_data.count,
-                "pagination_id": result.get("pagination_id"),
-                "has_more": result.get("has_more", False),
-                "time_range": {
-                    "from": from_ts_value,
-                    "to": to_ts_value,
-                },
-                "filters": {
-                    "apps": request_data.apps,
-                    "hosts": request_data.hosts,
-                    "levels": request_data.levels,
-                    "query": request_data.query,
-                },
-                "correlation_id": correlation_id,
-            },
-        }
+    correlation_id = new_correlation_id()
 
-    except MezmoAPIError as e:
-        # Handle Mezmo API specific errors
-        error_type = "MezmoAPIError"
-        is_rate_limit = e.status_code == 429
-        is_circuit_breaker = e.status_code == 503
+    # Unfiltered calls (the common discovery case) skip the validators, which
+    # only act on filters; anything else gets full Pydantic validation
+    request_data = None
+    if all(v is None for v in (apps, hosts, levels, query, from_ts, to_ts)):
+        request_data = _unfiltered_logs_request(count, prefer, pagination_id)
 
-        # Log error
-        logger.error(
-            "Failed to retrieve logs from Mezmo",
-            error=str(e),
-            error_type=error_type,
-            status_code=e.status_code,
-            count=request_data.count,
-            apps=request_data.apps,
-            is_rate_limit=is_rate_limit,
-            retry_after=e.retry_after,
-        )
-
-        # Update error metrics
-        if ENABLE_METRICS:
-            if is_rate_limit:
-                status = "rate_limited"
-            elif is_circuit_breaker:
-                status = "circuit_breaker_open"
-            else:
-                status = "error"
-            REQUEST_COUNT.labels(tool_name="get_logs", status=status).inc()
-            REQUEST_LATENCY.labels(tool_name="get_logs").observe(
-                time.time() - start_time
+    try:
+        if request_data is None:
+            request_data = LogsRequest.model_validate(
+                {
+                    "count": count,
+                    "apps": apps,
+                    "hosts": hosts,
+                    "levels": levels,
+                    "query": query,
+                    "from_ts": from_ts,
+                    "to_ts": to_ts,
+                    "prefer": prefer,
+                    "pagination_id": pagination_id,
+                }
             )
-
-        # Provide helpful error message based on error type
-        error_msg = _build_error_message(e, request_data)
-
-        # Notify client of error
-        await ctx.error(error_msg)
-
-        # Always raise ToolError so the agent knows the tool failed
-        raise ToolError(error_msg)
-
-    except Exception as e:
-        # Handle unexpected errors
-        error_type = type(e).__name__
-
-        # Log error
+    except ValidationError as e:
         logger.error(
-            "Unexpected error retrieving logs from Mezmo",
+            "Invalid request parameters",
+            tool="get_logs",
+            correlation_id=correlation_id,
             error=str(e),
-            error_type=error_type,
-            count=request_data.count,
-            apps=request_data.apps,
         )
+        _GET_LOGS_VALIDATION_ERROR.inc()
+        raise ToolError(str(e))
 
-        # Update error metrics
-        if ENABLE_METRICS:
-            REQUEST_COUNT.labels(tool_name="get_logs", status="error").inc()
-            REQUEST_LATENCY.labels(tool_name="get_logs").observe(
-                time.time() - start_time
-            )
-
-        error_msg = f"Failed to retrieve logs from Mezmo: {str(e)}"
-
-        # Notify client of error
-        await ctx.error(error_msg)
+    # Normalized filters, read once and reused for logging, the fetch and metadata
+    apps, hosts, levels, query = (
+        request_data.apps,
+        request_data.hosts,
+        request_data.levels,
+        request_data.query,
+    )
 
-        # Always raise ToolError so the agent knows the tool failed
-        raise ToolError(error_msg)
+    # Every log line from here on, including those from mezmo_api, carries the
+    # request context
+    with bound_contextvars(
+        tool="get_logs",
+        correlation_id=correlation_id,
+        count=request_data.count,
+        apps=apps,
+        hosts=hosts,
+        levels=levels,
+        query=query,
+        prefer=request_data.prefer,
+    ):
+        logger.info("Processing get_logs request")
+
+        # Latency covers everything after validation, including any wait for a
+        # tool-call slot, success or failure
+        with _GET_LOGS_LATENCY.time():
+            async with _tool_call_slot():
+                try:
+                    # Pre-call progress is opt-in; it costs an extra MCP message per call
+                    if VERBOSE_PROGRESS:
+                        await ctx.info(f"Fetching {request_data.count} logs from Mezmo API...")
+
+                    # Call the Mezmo API
+                    result = await fetch_latest_logs(
+                        count=request_data.count,
+                        apps=apps,
+                        hosts=hosts,
+                        levels=levels,
+                        query=query,
+                        from_ts=request_data.from_ts,
+                        to_ts=request_data.to_ts,
+                        prefer=request_data.prefer,
+                        pagination_id=request_data.pagination_id,
+                        correlation_id=correlation_id,
+                    )
+
+                    logs = result.get("logs", [])
+                    logs_count = len(logs)
+
+                    # Log success
+                    logger.info(
+                        "Successfully retrieved logs from Mezmo",
+                        logs_count=logs_count,
+                    )
+
+                    # Update metrics
+                    _GET_LOGS_SUCCESS.inc()
+                    LOGS_FETCHED.inc(logs_count)
+
+                    # Let the client know when Mezmo was unreachable and cached data was served
+                    if result.get("stale"):
+                        await ctx.warning(
+                            "Mezmo API is currently unavailable; returning the last successful "
+                            f"results for this query, from {result['stale_age_seconds']:.0f}s ago."
+                        )
+
+                    # Provide guidance for empty results
+                    if logs_count == 0:
+                        await ctx.info(
+                            "No logs found. Suggestions:\n"
+                            "1. Expand time range (from_ts further back)\n"
+                            "2. Remove filters to discover available apps\n"
+                            "3. Check app names with list_apps tool"
+                        )
+                    else:
+                        # Notify client of completion
+                        await ctx.info(f"Successfully retrieved {logs_count} logs")
+
+                    # Build time range for metadata
+                    now = int(time.time())
+                    from_ts_value = request_data.from_ts or str(now - DEFAULT_TIME_WINDOW_SECONDS)
+                    to_ts_value = request_data.to_ts or str(now)
+
+                    # Return structured response with metadata
+                    return {
+                        "logs": logs,
+                        "metadata": {
+                            "count": logs_count,
+                            "requested_count": request_data.count,
+                            "pagination_id": result.get("pagination_id"),
+                            "has_more": result.get("has_more", False),
+                            "stale": result.get("stale", False),
+                            "stale_age_seconds": result.get("stale_age_seconds"),
+                            "time_range": {
+                                "from": from_ts_value,
+                                "to": to_ts_value,
+                            },
+                            "filters": {
+                                "apps": apps,
+                                "hosts": hosts,
+                                "levels": levels,
+                                "query": query,
+                            },
+                            "correlation_id": correlation_id,
+                        },
+                    }
+
+                except MezmoAPIError as e:
+                    # Handle Mezmo API specific errors
+                    error_type = "MezmoAPIError"
+
+                    # Log error
+                    logger.error(
+                        "Failed to retrieve logs from Mezmo",
+                        error=str(e),
+                        error_type=error_type,
+                        status_code=e.status_code,
+                        is_rate_limit=e.status_code == 429,
+                        retry_after=e.retry_after,
+                    )
+
+                    # Update error metrics
+                    _GET_LOGS_ERROR_BY_STATUS.get(e.status_code, _GET_LOGS_ERROR).inc()
+
+                    # Provide helpful error message based on error type
+                    error_msg = _build_error_message(e, request_data)
+
+                    # Notify client of error
+                    await ctx.error(error_msg)
+
+                    # Always raise ToolError so the agent knows the tool failed
+                    raise ToolError(error_msg)
+
+                except Exception as e:
+                    # Handle unexpected errors
+                    error_type = type(e).__name__
+
+                    # Log error
+                    logger.error(
+                        "Unexpected error retrieving logs from Mezmo",
+                        error=str(e),
+                        error_type=error_type,
+                    )
+
+                    # Update error metrics
+                    _GET_LOGS_ERROR.inc()
+
+                    error_msg = f"Failed to retrieve logs from Mezmo: {str(e)}"
+
+                    # Notify client of error
+                    await ctx.error(error_msg)
+
+                    # Always raise ToolError so the agent knows the tool failed
+                    raise ToolError(error_msg)
 
 
 @mcp.resource("health://status")
@@ -517,29 +751,29 @@ async def health_check() -> str:
 
     Returns comprehensive health status including dependency checks.
     """
+    global _health_cache
+
+    # Probes poll this frequently; reuse the payload for up to a second
+    now = time.monotonic()
+    cached_at, cached_payload = _health_cache
+    if now - cached_at < _HEALTH_CACHE_TTL:
+        return cached_payload
+
     try:
-        # Check Mezmo API connectivity (optional quick check)
-        health_data = HealthResponse(
-            status="healthy",
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-            dependencies={
-                "mezmo_api": "available",
-                "metrics": "enabled" if ENABLE_METRICS else "disabled",
-                "auth": "enabled" if ENABLE_AUTH else "disabled",
-            },
-        )
+        payload = _HEALTHY_TEMPLATE % _utc_timestamp()
+        _health_cache = (now, payload)
 
-        logger.debug("Health check performed", status=health_data.status)
-        return health_data.model_dump_json()
+        logger.debug("Health check performed", status="healthy")
+        return payload
 
     except Exception as e:
         logger.error("Health check failed", error=str(e))
         error_response = HealthResponse(
             status="unhealthy",
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            timestamp=_utc_timestamp(),
             dependencies={"error": str(e)},
         )
-        return error_response.model_dump_json()
+        return orjson.dumps(error_response.model_dump()).decode()
 
 
 @mcp.tool
@@ -562,69 +796,57 @@ async def list_apps(
     Example:
         list_apps() -> {"apps": ["web-api", "worker", "scheduler"], "count": 3}
     """
-    correlation_id = str(uuid.uuid4())
+    correlation_id = new_correlation_id()
 
-    # Record metrics
-    start_time = time.time()
-    if ENABLE_METRICS:
-        REQUEST_COUNT.labels(tool_name="list_apps", status="started").inc()
+    with _LIST_APPS_LATENCY.time():
+        async with _tool_call_slot():
+            try:
+                await ctx.info("Discovering available applications...")
 
-    try:
-        await ctx.info("Discovering available applications...")
+                # Calculate time range
+                now = int(time.time())
+                from_ts = str(now - (hours * 3600))
 
-        # Calculate time range
-        now = int(time.time())
-        from_ts = str(now - (hours * 3600))
+                # Fetch a sample of logs to discover apps
+                result = await fetch_latest_logs(
+                    count=100,
+                    from_ts=from_ts,
+                    to_ts=str(now),
+                    correlation_id=correlation_id,
+                )
 
-        # Fetch a sample of logs to discover apps
-        result = await fetch_latest_logs(
-            count=100,
-            from_ts=from_ts,
-            to_ts=str(now),
-            correlation_id=correlation_id,
-        )
+                logs = result.get("logs", [])
 
-        logs = result.get("logs", [])
+                # Extract unique app names
+                apps = {app for app in (log.get("_app") for log in logs) if app}
 
-        # Extract unique app names
-        apps = set()
-        for log in logs:
-            app = log.get("_app")
-            if app:
-                apps.add(app)
-
-        # Update metrics
-        if ENABLE_METRICS:
-            REQUEST_COUNT.labels(tool_name="list_apps", status="success").inc()
-            REQUEST_LATENCY.labels(tool_name="list_apps").observe(
-                time.time() - start_time
-            )
+                # Update metrics
+                _LIST_APPS_SUCCESS.inc()
 
-        sorted_apps = sorted(apps)
-        await ctx.info(f"Found {len(sorted_apps)} unique applications")
+                sorted_apps = sorted(apps)
+                app_count = len(sorted_apps)
+                await ctx.info(f"Found {app_count} unique applications")
 
-        return {
-            "apps": sorted_apps,
-            "count": len(sorted_apps),
-            "sample_size": len(logs),
-            "hours_searched": hours,
-        }
+                return {
+                    "apps": sorted_apps,
+                    "count": app_count,
+                    "sample_size": len(logs),
+                    "hours_searched": hours,
+                }
 
-    except MezmoAPIError as e:
-        if ENABLE_METRICS:
-            REQUEST_COUNT.labels(tool_name="list_apps", status="error").inc()
+            except MezmoAPIError as e:
+                _LIST_APPS_ERROR.inc()
 
-        error_msg = f"Failed to discover apps: {e.message}"
-        await ctx.error(error_msg)
-        raise ToolError(error_msg)
+                error_msg = f"Failed to discover apps: {e.message}"
+                await ctx.error(error_msg)
+                raise ToolError(error_msg)
 
-    except Exception as e:
-        if ENABLE_METRICS:
-            REQUEST_COUNT.labels(tool_name="list_apps", status="error").inc()
+            except Exception as e:
+                _LIST_APPS_ERROR.inc()
 
-        error_msg = f"Failed to discover apps: {str(e)}"
-        await ctx.error(error_msg)
-        raise ToolError(error_msg)
+                error_msg = f"Failed to discover apps: {str(e)}"
+                await ctx.error(error_msg)
+                raise ToolError(error_msg)
 
 
 @mcp.tool
@@ -653,103 +875,70 @@ async def get_log_stats(
             "total_sampled": 100
         }
     """
-    correlation_id = str(uuid.uuid4())
-
-    # Record metrics
-    start_time = time.time()
-    if ENABLE_METRICS:
-        REQUEST_COUNT.labels(tool_name="get_log_stats", status="started").inc()
-
-    try:
-        await ctx.info("Gathering log statistics...")
-
-        # Calculate time range
-        now = int(time.time())
-        from_ts = str(now - (hours * 3600))
-
-        # Fetch a sample of logs
-        result = await fetch_latest_logs(
-            count=200,
-            apps=apps,
-            from_ts=from_ts,
-            to_ts=str(now),
-            correlation_id=correlation_id,
-        )
-
-        logs = result.get("logs", [])
-
-        # Calculate level distribution
-        level_counts: Dict[str, int] = {}
-        app_counts: Dict[str, int] = {}
-
-        for log in logs:
-            # Count by level
-            level = log.get("_level", "UNKNOWN")
-            if isinstance(level, str):
-                level = level.upper()
-            level_counts[level] = level_counts.get(level, 0) + 1
-
-            # Count by app
-            app = log.get("_app", "unknown")
-            app_counts[app] = app_counts.get(app, 0) + 1
-
-        # Sort apps by count (descending)
-        top_apps = sorted(
-            [{"app": app, "count": count} for app, count in app_counts.items()],
-            key=lambda x: x["count"],
-            reverse=True,
-        )[:10]  # Top 10 apps
-
-        # Update metrics
-        if ENABLE_METRICS:
-            REQUEST_COUNT.labels(tool_name="get_log_stats", status="success").inc()
-            REQUEST_LATENCY.labels(tool_name="get_log_stats").observe(
-                time.time() - start_time
-            )
-
-        await ctx.info(f"Analyzed {len(logs)} logs across {len(app_counts)} apps")
-
-        return {
-            "level_distribution": level_counts,
-            "top_apps": top_apps,
-            "total_sampled": len(logs),
-            "hours_analyzed": hours,
-            "filters_applied": {"apps": apps} if apps else None,
-        }
-
-    except MezmoAPIError as e:
-        if ENABLE_METRICS:
-            REQUEST_COUNT.labels(tool_name="get_log_stats", status="error").inc()
-
-        error_msg = f"Failed to get log stats: {e.message}"
-        await ctx.error(error_msg)
-        raise ToolError(error_msg)
-
-    except Exception as e:
-        if ENABLE_METRICS:
-            REQUEST_COUNT.labels(tool_name="get_log_stats", status="error").inc()
-
-        error_msg = f"Failed to get log stats: {str(e)}"
-        await ctx.error(error_msg)
-        raise ToolError(error_msg)
-
-
-@mcp.prompt
-async def analyze_logs(
-    ctx: Context, query: str, time_range: str = "1h", log_level: str = "ERROR,WARNING"
-) -> str:
-    """
-    Generate a prompt for analyzing logs with specific criteria.
-
-    Args:
-        query: Search query for log analysis
-        time_range: Time range for analysis (e.g., "1h", "24h")
-        log_level: Log level to focus on (default: ERROR,WARNING)
-
-    Returns:
-        Formatted prompt for log analysis
-    """
-    prompt = f"""
+    correlation_id = new_correlation_id()
+
+    with _LOG_STATS_LATENCY.time():
+        async with _tool_call_slot():
+            try:
+                await ctx.info("Gathering log statistics...")
+
+                # Calculate time range
+                now = int(time.time())
+                from_ts = str(now - (hours * 3600))
+
+                # Fetch a sample of logs
+                result = await fetch_latest_logs(
+                    count=200,
+                    apps=apps,
+                    from_ts=from_ts,
+                    to_ts=str(now),
+                    correlation_id=correlation_id,
+                )
+
+                logs = result.get("logs", [])
+
+                # Tally levels and apps in one pass each
+                level_counts = collections.Counter(
+                    level.upper() if isinstance(level, str) else level
+                    for level in (log.get("_level", "UNKNOWN") for log in logs)
+                )
+                app_counts = collections.Counter(log.get("_app", "unknown") for log in logs)
+
+                # Top 10 apps by count (descending)
+                top_apps = [
+                    {"app": app, "count": count} for app, count in app_counts.most_common(10)
+                ]
+
+                # Update metrics
+                _LOG_STATS_SUCCESS.inc()
+
+                await ctx.info(f"Analyzed {len(logs)} logs across {len(app_counts)} apps")
+
+                return {
+                    "level_distribution": dict(level_counts),
+                    "top_apps": top_apps,
+                    "total_sampled": len(logs),
+                    "hours_analyzed": hours,
+                    "filters_applied": {"apps": apps} if apps else None,
+                }
+
+            except MezmoAPIError as e:
+                _LOG_STATS_ERROR.inc()
+
+                error_msg = f"Failed to get log stats: {e.message}"
+                await ctx.error(error_msg)
+                raise ToolError(error_msg)
+
+            except Exception as e:
+                _LOG_STATS_ERROR.inc()
+
+                error_msg = f"Failed to get log stats: {str(e)}"
+                await ctx.error(error_msg)
+                raise ToolError(error_msg)
+
+
+# Static analyze_logs prompt; only the three criteria are filled in per call
+_ANALYZE_TEMPLATE = """
 Please analyze the logs from Mezmo with the following criteria:
 
 Search Query: {query}
@@ -808,6 +997,22 @@ QUOTA BEST PRACTICES:
 Focus on actionable insights that help with immediate troubleshooting while respecting account quota limits.
 """
 
+
+@mcp.prompt
+async def analyze_logs(
+    ctx: Context, query: str, time_range: str = "1h", log_level: str = "ERROR,WARNING"
+) -> str:
+    """
+    Generate a prompt for analyzing logs with specific criteria.
+
+    Args:
+        query: Search query for log analysis
+        time_range: Time range for analysis (e.g., "1h", "24h")
+        log_level: Log level to focus on (default: ERROR,WARNING)
+
+    Returns:
+        Formatted prompt for log analysis
+    """
     logger.info(
         "Generated log analysis prompt",
         query=query,
@@ -815,7 +1020,7 @@ Focus on actionable insights that help with immediate troubleshooting while resp
         log_level=log_level,
     )
 
-    return prompt
+    return _ANALYZE_TEMPLATE.format(query=query, time_range=time_range, log_level=log_level)
 
 
 def create_app():
@@ -857,16 +1062,36 @@ def main():
     )
     args = parser.parse_args()
 
-    # Send structlog output to stderr so it doesn't interfere with stdio transport
-    logging.basicConfig(stream=sys.stderr, level=getattr(logging, args.log_level.upper(), logging.INFO))
+    # Send structlog output to stderr so it doesn't interfere with stdio transport.
+    # Records are queued and written by a background thread, so tool handlers
+    # never block on the stream or its handler lock.
+    log_queue = queue.SimpleQueue()
+    log_listener = QueueListener(log_queue, logging.StreamHandler(sys.stderr))
+    logging.basicConfig(
+        handlers=[QueueHandler(log_queue)],
+        level=getattr(logging, args.log_level.upper(), logging.INFO),
+    )
+    log_listener.start()
 
-    if args.transport == "stdio":
-        # stdio mode: no metrics server, MCP client spawns us directly
-        mcp.run(transport="stdio")
+    # Prefer uvloop's faster event loop where it's installed (not on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not available, using the default asyncio event loop")
     else:
-        # HTTP mode: full init with metrics
-        initialize_server()
-        mcp.run(transport="http", host=args.host, port=args.port, path="/mcp")
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    try:
+        if args.transport == "stdio":
+            # stdio mode: no metrics server, MCP client spawns us directly
+            mcp.run(transport="stdio")
+        else:
+            # HTTP mode: full init with metrics
+            initialize_server()
+            mcp.run(transport="http", host=args.host, port=args.port, path="/mcp")
+    finally:
+        # Flush anything still queued before the process exits
+        log_listener.stop()
 
 
 if __name__ == "__main__":